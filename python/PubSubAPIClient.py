@@ -7,29 +7,192 @@ This is the CORRECT way to implement the Trailhead module in Python,
 following the official Salesforce Python Quick Start guide.
 """
 
+import asyncio
+import collections
 import grpc
-import threading
+import grpc.aio
+import itertools
+import logging
+import logging.handlers
+import os
+import sys
 import time
 import io
 import json
-import avro.schema
-import avro.io
+import string
+from xml.sax.saxutils import escape
 import certifi
+from fastavro import parse_schema, schemaless_reader
 
 # Import the generated protobuf files (generated from Salesforce proto file)
 import pubsub_api_pb2 as pb2
 import pubsub_api_pb2_grpc as pb2_grpc
 
+logger = logging.getLogger(__name__)
+
+# SOAP envelope for login; values must be XML-escaped before substitution
+_LOGIN_SOAP = string.Template("""<?xml version="1.0" encoding="utf-8"?>
+        <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" xmlns:urn="urn:enterprise.soap.sforce.com">
+           <soapenv:Header/>
+           <soapenv:Body>
+              <urn:login>
+                 <urn:username>$username</urn:username>
+                 <urn:password>$password</urn:password>
+              </urn:login>
+           </soapenv:Body>
+        </soapenv:Envelope>""")
+
+# Channel options shared by every channel in the pool. Keepalive pings keep
+# an active subscription's connection from being dropped by idle middleboxes
+# during quiet periods. 5 minutes matches the default minimum ping interval
+# gRPC servers enforce; pinging more often, or with no active call, gets the
+# connection closed with GOAWAY too_many_pings.
+CHANNEL_OPTIONS = [
+    ('grpc.keepalive_time_ms', 300000),
+    # Skip per-call channelz bookkeeping. Retries stay enabled: the client
+    # has no reconnect logic, so transparent retries are what let a
+    # Subscribe that races a GOAWAY succeed instead of failing outright.
+    ('grpc.enable_channelz', 0),
+    # A full batch of large change events can exceed gRPC's 4 MB default
+    # receive limit (the send size is unlimited by default)
+    ('grpc.max_receive_message_length', 64 * 1024 * 1024),
+]
+
+# ChangeEventHeader fields, read once per event into a tuple so downstream
+# code uses attribute access instead of repeated dict lookups
+ChangeEventHeader = collections.namedtuple('ChangeEventHeader', [
+    'entityName', 'recordIds', 'changeType', 'changeOrigin',
+    'transactionKey', 'sequenceNumber', 'commitTimestamp', 'commitNumber',
+    'commitUser', 'nulledFields', 'diffFields', 'changedFields'
+])
+
+class BatchedStreamHandler(logging.handlers.MemoryHandler):
+    """
+    Buffer log records and write them to a stream with a single write()
+    and flush() per flush, instead of one of each per record
+    Flushed once per FetchResponse batch, when capacity is reached, or
+    immediately for records at flushLevel and above
+    """
+    
+    def __init__(self, stream, capacity=100, flushLevel=logging.ERROR):
+        super().__init__(capacity, flushLevel=flushLevel)
+        self.stream = stream
+    
+    def flush(self):
+        # Like StreamHandler.emit, failures go to handleError rather than
+        # propagating, and the buffer is always cleared so one bad record
+        # or a broken stdout can't wedge every later flush
+        self.acquire()
+        try:
+            if not self.buffer:
+                return
+            lines = []
+            for record in self.buffer:
+                try:
+                    lines.append(self.format(record) + "\n")
+                except Exception:
+                    self.handleError(record)
+            try:
+                self.stream.write("".join(lines))
+                self.stream.flush()
+            except Exception:
+                self.handleError(self.buffer[-1])
+            finally:
+                self.buffer.clear()
+        finally:
+            self.release()
+
+def _flush_log_handlers():
+    """Write out any buffered log records (called once per FetchResponse)"""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+def _bitmap_positions(bitmap):
+    """
+    Yield the positions of the set bits in a '0x...' hex bitmap
+    Position 0 is the least significant bit, i.e. the first schema field
+    """
+    bits = int(bitmap, 16)
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+class ChannelPool:
+    """
+    Fixed pool of independent gRPC channels handed out round-robin
+    Each channel gets its own HTTP/2 connection, so the subscribe stream
+    and unary calls such as GetSchema don't share flow-control windows.
+    Channels connect lazily, so unused pool slots cost nothing.
+    """
+    
+    def __init__(self, target='api.pubsub.salesforce.com:7443', size=4,
+                 credentials=None):
+        if credentials is None:
+            credentials = grpc.ssl_channel_credentials()
+        
+        # A local subchannel pool stops gRPC from collapsing channels with
+        # identical arguments onto one shared TCP connection
+        options = CHANNEL_OPTIONS + [('grpc.use_local_subchannel_pool', 1)]
+        self._channels = [
+            grpc.aio.secure_channel(target, credentials, options=options)
+            for _ in range(size)
+        ]
+        self._counter = itertools.count()
+    
+    def next_channel(self):
+        """Return the next channel in round-robin order"""
+        return self._channels[next(self._counter) % len(self._channels)]
+    
+    @classmethod
+    def from_environment(cls, size=4):
+        """
+        Create a pool for the Pub/Sub API endpoint
+        If PUBSUB_UDS_PATH is set, connect to a colocated sidecar proxy
+        (e.g. Envoy) over that Unix domain socket instead; the proxy
+        handles TLS to Salesforce, so the local hop skips TCP entirely
+        """
+        uds_path = os.environ.get('PUBSUB_UDS_PATH')
+        if uds_path:
+            return cls(f'unix:{uds_path}', size,
+                       grpc.local_channel_credentials(grpc.LocalConnectionType.UDS))
+        return cls(size=size)
+    
+    async def close(self):
+        """Close every channel in the pool"""
+        await asyncio.gather(*(channel.close() for channel in self._channels))
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
 class SalesforcePubSubClient:
-    def __init__(self):
-        # Semaphore for flow control (as mentioned in official docs)
-        self.semaphore = threading.Semaphore(1)
+    def __init__(self, batch_size=100):
+        # Credit-based flow control: the consumer grants credits, the
+        # FetchRequest stream spends them. The stream only parks on a
+        # future when it has run out, and is woken only in that case.
+        self._credits = 0           # events granted but not yet requested
+        self._credit_waiter = None  # future the stream waits on, if blocked
+        
+        # Events requested per FetchRequest (Pub/Sub API allows at most 100).
+        # A new FetchRequest tops the window back up once half of it has
+        # been delivered, rather than round-tripping once per event.
+        self.batch_size = batch_size
+        self._outstanding = 0       # events requested but not yet received
         self.latest_replay_id = None
         
+        # Schemas are immutable per schema_id, so parse and fetch each one once
+        self._schema_cache = {}        # schema_id -> parsed schema
+        self._schema_json_cache = {}   # schema_id -> schema JSON
+        self._field_table_cache = {}   # schema_id -> [(field name, nested field names)]
+        
         # These will be set from your Salesforce org
         self.session_id = ''      # Your Salesforce session ID
         self.instance_url = ''    # Your Salesforce instance URL
         self.tenant_id = ''       # Your org ID
+        self._auth_metadata = ()
         
     def setup_credentials(self, session_id, instance_url, tenant_id):
         """Set up Salesforce authentication credentials"""
@@ -37,6 +200,13 @@ class SalesforcePubSubClient:
         self.instance_url = instance_url
         self.tenant_id = tenant_id
         
+        # Build the gRPC metadata once; every RPC reuses the same tuple
+        self._auth_metadata = (
+            ('accesstoken', session_id),
+            ('instanceurl', instance_url),
+            ('tenantid', tenant_id)
+        )
+        
     def get_session_token(self, username, password, login_url):
         """
         Get session token using SOAP login (as shown in official docs)
@@ -45,83 +215,143 @@ class SalesforcePubSubClient:
         import requests
         import xml.etree.ElementTree as ET
         
-        # SOAP envelope for login
-        soap_body = f"""<?xml version="1.0" encoding="utf-8"?>
-        <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" xmlns:urn="urn:enterprise.soap.sforce.com">
-           <soapenv:Header/>
-           <soapenv:Body>
-              <urn:login>
-                 <urn:username>{username}</urn:username>
-                 <urn:password>{password}</urn:password>
-              </urn:login>
-           </soapenv:Body>
-        </soapenv:Envelope>"""
+        # SOAP envelope for login (escaped so characters such as & or <
+        # in a password can't break or inject into the XML)
+        soap_body = _LOGIN_SOAP.substitute(
+            username=escape(username),
+            password=escape(password)
+        )
         
         headers = {
             'Content-Type': 'text/xml; charset=UTF-8',
             'SOAPAction': 'login'
         }
         
-        response = requests.post(
+        # Stream the response so it can be parsed incrementally
+        with requests.post(
             f"{login_url}/services/Soap/c/59.0/",
             data=soap_body,
-            headers=headers
-        )
-        
-        if response.status_code == 200:
-            # Parse SOAP response
-            root = ET.fromstring(response.content)
+            headers=headers,
+            stream=True
+        ) as response:
             
-            # Extract session ID and server URL
-            session_id = root.find('.//{urn:enterprise.soap.sforce.com}sessionId').text
-            server_url = root.find('.//{urn:enterprise.soap.sforce.com}serverUrl').text
+            if response.status_code != 200:
+                print(f"Login failed: {response.status_code} - {response.text}")
+                return False
             
-            # Extract instance URL and org ID
-            instance_url = server_url.split('/services')[0]
-            
-            # You'll need to get the org ID from describe or from the server URL
-            # For simplicity, using a placeholder
-            tenant_id = "your_org_id_here"
-            
-            self.setup_credentials(session_id, instance_url, tenant_id)
-            return True
-        else:
-            print(f"Login failed: {response.status_code} - {response.text}")
+            # Parse SOAP response, stopping as soon as both fields are seen
+            # instead of building the whole document tree
+            response.raw.decode_content = True
+            session_id = server_url = None
+            for _, elem in ET.iterparse(response.raw, events=('end',)):
+                if elem.tag == '{urn:enterprise.soap.sforce.com}sessionId':
+                    session_id = elem.text
+                elif elem.tag == '{urn:enterprise.soap.sforce.com}serverUrl':
+                    server_url = elem.text
+                if session_id and server_url:
+                    break
+                elem.clear()
+        
+        if not (session_id and server_url):
+            print("Login failed: sessionId/serverUrl missing from login response")
             return False
+        
+        # Extract instance URL and org ID
+        instance_url = server_url.split('/services')[0]
+        
+        # You'll need to get the org ID from describe or from the server URL
+        # For simplicity, using a placeholder
+        tenant_id = "your_org_id_here"
+        
+        self.setup_credentials(session_id, instance_url, tenant_id)
+        return True
     
     def create_auth_metadata(self):
-        """Create gRPC metadata headers for authentication (official format)"""
-        return (
-            ('accesstoken', self.session_id),
-            ('instanceurl', self.instance_url),
-            ('tenantid', self.tenant_id)
-        )
+        """Return gRPC metadata headers for authentication (official format)"""
+        return self._auth_metadata
     
-    def fetch_req_stream(self, topic):
+    async def fetch_req_stream(self, topic):
         """
-        Generator function to create FetchRequest stream
+        Async generator function to create FetchRequest stream
         This is the exact pattern from official Salesforce docs
         """
         while True:
-            self.semaphore.acquire()
+            # Only wait when no credits remain
+            while self._credits <= 0:
+                self._credit_waiter = asyncio.get_running_loop().create_future()
+                try:
+                    await self._credit_waiter
+                finally:
+                    self._credit_waiter = None
+            
+            num_requested, self._credits = self._credits, 0
             yield pb2.FetchRequest(
                 topic_name=topic,
                 replay_preset=pb2.ReplayPreset.LATEST,
-                num_requested=1  # Request 1 event at a time for simplicity
+                num_requested=num_requested
             )
     
-    def decode_event(self, schema_json, payload):
+    def replenish_credits(self, received):
+        """
+        Account for delivered events and grant new credits when the
+        outstanding request window drops to half of batch_size
+        """
+        self._outstanding -= received
+        if self._outstanding <= self.batch_size // 2:
+            self._credits += self.batch_size - self._outstanding
+            self._outstanding = self.batch_size
+
+            # Wake the stream only if it is actually waiting for credits
+            if self._credit_waiter is not None and not self._credit_waiter.done():
+                self._credit_waiter.set_result(None)
+    
+    def decode_event(self, schema_id, schema_json, payload):
         """
         Decode Avro payload using schema
         This is required for Salesforce events
         """
-        schema = avro.schema.parse(schema_json)
-        buf = io.BytesIO(payload)
-        decoder = avro.io.BinaryDecoder(buf)
-        reader = avro.io.DatumReader(schema)
-        return reader.read(decoder)
+        schema = self.get_parsed_schema(schema_id, schema_json)
+        
+        # fastavro keeps no reusable reader/decoder state beyond the parsed
+        # schema, and BytesIO over immutable bytes shares the payload buffer
+        # instead of copying it, so a fresh wrapper per event is the cheapest
+        # option (a reused, rewritten BytesIO would force a copy). A Python
+        # memoryview cursor avoids the wrapper but is slower overall, since
+        # every fastavro read() then runs as Python code instead of C.
+        return schemaless_reader(io.BytesIO(payload), schema)
     
-    def subscribe_to_topic(self, topic_name="/data/Employee__ChangeEvent"):
+    def get_parsed_schema(self, schema_id, schema_json):
+        """Parse schema JSON with fastavro, once per schema ID"""
+        schema = self._schema_cache.get(schema_id)
+        if schema is None:
+            schema = parse_schema(json.loads(schema_json))
+            self._schema_cache[schema_id] = schema
+        return schema
+    
+    async def get_schema_json(self, schema_id, stub, auth_metadata):
+        """
+        Fetch schema JSON from Salesforce, once per schema ID
+        Schema IDs are immutable, so a cached schema never goes stale
+        """
+        schema_json = self._schema_json_cache.get(schema_id)
+        if schema_json is None:
+            schema_request = pb2.SchemaRequest(schema_id=schema_id)
+            schema_response = await stub.GetSchema(schema_request, metadata=auth_metadata)
+            schema_json = schema_response.schema_json
+            self._schema_json_cache[schema_id] = schema_json
+        return schema_json
+    
+    async def prefetch_topic_schema(self, topic_name, stub, auth_metadata):
+        """
+        Warm the schema caches with the topic's current schema
+        so the first event doesn't wait on a GetSchema round-trip
+        """
+        topic_request = pb2.TopicRequest(topic_name=topic_name)
+        topic_info = await stub.GetTopic(topic_request, metadata=auth_metadata)
+        schema_json = await self.get_schema_json(topic_info.schema_id, stub, auth_metadata)
+        self.get_parsed_schema(topic_info.schema_id, schema_json)
+    
+    async def subscribe_to_topic(self, topic_name="/data/Employee__ChangeEvent"):
         """
         Subscribe to Change Data Capture events
         This follows the exact pattern from Salesforce Python Quick Start
@@ -130,17 +360,31 @@ class SalesforcePubSubClient:
         print("Waiting for events... (Make changes to Employee records in Salesforce)")
         print("=" * 60)
         
-        # Create secure gRPC channel (official Salesforce endpoint)
-        with grpc.secure_channel('api.pubsub.salesforce.com:7443', 
-                               grpc.ssl_channel_credentials()) as channel:
+        # Create secure asyncio gRPC channels (official Salesforce endpoint)
+        async with ChannelPool.from_environment() as pool:
             
-            # Create authentication metadata
-            auth_metadata = self.create_auth_metadata()
+            # Authentication metadata, built once by setup_credentials
+            auth_metadata = self._auth_metadata
             
-            # Create stub
-            stub = pb2_grpc.PubSubStub(channel)
+            # Create stubs: the event stream and schema lookups use separate
+            # channels so GetSchema calls don't contend with the stream
+            stub = pb2_grpc.PubSubStub(pool.next_channel())
+            schema_stub = pb2_grpc.PubSubStub(pool.next_channel())
             
+            # Warm-up only: on failure the first event fetches its schema
             try:
+                await self.prefetch_topic_schema(topic_name, schema_stub, auth_metadata)
+            except grpc.RpcError as e:
+                logger.warning("Schema prefetch failed, continuing: %s - %s",
+                               e.code(), e.details())
+            except Exception as e:
+                logger.warning("Schema prefetch failed, continuing: %s", e)
+            
+            try:
+                # The first FetchRequest asks for a full batch
+                self._credits = self.batch_size
+                self._outstanding = self.batch_size
+                
                 # Subscribe to the event stream
                 substream = stub.Subscribe(
                     self.fetch_req_stream(topic_name), 
@@ -148,108 +392,170 @@ class SalesforcePubSubClient:
                 )
                 
                 # Process incoming events
-                for event in substream:
+                async for event in substream:
                     if event.events:
-                        for evt in event.events:
-                            self.process_event(evt, stub, auth_metadata)
+                        await self.process_events(event.events, schema_stub, auth_metadata)
                     else:
-                        print("No events received in this batch")
+                        logger.info("No events received in this batch")
+                    
+                    # Grant credits for the next request once enough of the
+                    # window has been consumed (keepalives deliver nothing)
+                    self.replenish_credits(len(event.events))
                     
-                    # Release semaphore for next request
-                    self.semaphore.release()
+                    # Write this batch's output in one go
+                    _flush_log_handlers()
                     
             except grpc.RpcError as e:
-                print(f"gRPC error: {e.code()} - {e.details()}")
+                logger.error("gRPC error: %s - %s", e.code(), e.details())
             except Exception as e:
-                print(f"Subscription error: {e}")
+                logger.error("Subscription error: %s", e)
     
-    def process_event(self, event, stub, auth_metadata):
+    async def process_events(self, events, stub, auth_metadata):
+        """
+        Decode and process one FetchResponse batch, in delivery order
+        Every schema in the batch is fetched and parsed up front; events
+        whose schema could not be fetched are skipped
+        """
+        for schema_id in {evt.event.schema_id for evt in events}:
+            try:
+                schema_json = await self.get_schema_json(schema_id, stub, auth_metadata)
+                self.get_parsed_schema(schema_id, schema_json)
+            except Exception as e:
+                logger.error("Error fetching schema %s: %s", schema_id, e)
+        
+        for evt in events:
+            schema_id = evt.event.schema_id
+            schema_json = self._schema_json_cache.get(schema_id)
+            if schema_json is None:
+                logger.error("Skipping event %s: schema %s unavailable",
+                             evt.replay_id.hex(), schema_id)
+                continue
+            
+            try:
+                decoded_event = self.decode_event(schema_id, schema_json, evt.event.payload)
+            except Exception as e:
+                logger.error("Error processing event: %s", e)
+                continue
+            
+            self.process_event(evt, decoded_event)
+    
+    def process_event(self, event, decoded_event):
         """
         Process individual Change Data Capture events
         Matches the expected output format from the Trailhead module
         """
         try:
-            # Get the schema for this event
-            schema_id = event.event.schema_id
-            
-            # Fetch schema from Salesforce
-            schema_request = pb2.SchemaRequest(schema_id=schema_id)
-            schema_response = stub.GetSchema(schema_request, metadata=auth_metadata)
-            schema_json = schema_response.schema_json
+            logger.info("%s\nRECEIVED CHANGE EVENT\n%s", "=" * 50, "=" * 50)
             
-            # Decode the event payload
-            decoded_event = self.decode_event(schema_json, event.event.payload)
-            
-            print("=" * 50)
-            print("RECEIVED CHANGE EVENT")
-            print("=" * 50)
-            
-            # Pretty print the event (same format as Java client output)
-            print(json.dumps(decoded_event, indent=2, default=str))
+            # Dump the full event only when debug logging is on, so the
+            # serialization never runs at the default INFO level
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("event: %s", json.dumps(decoded_event, default=str))
             
             # Store replay ID for potential replay
             self.latest_replay_id = event.replay_id
             
             # Process change event header fields if present
-            if 'ChangeEventHeader' in decoded_event:
-                self.process_change_event_header(decoded_event['ChangeEventHeader'])
+            header = decoded_event.get('ChangeEventHeader')
+            if header is not None:
+                header = ChangeEventHeader._make(map(header.get, ChangeEventHeader._fields))
+                self.process_change_event_header(header, event.event.schema_id)
                 
         except Exception as e:
-            print(f"Error processing event: {e}")
+            logger.error("Error processing event: %s", e)
     
-    def process_change_event_header(self, header):
+    def process_change_event_header(self, header, schema_id):
         """
-        Process ChangeEventHeader fields - specifically the changedFields bitmap
+        Process a ChangeEventHeader tuple - specifically the changedFields bitmap
         This matches the Java client's changedFields decoding output
         """
-        if 'changedFields' in header and header['changedFields']:
-            print("=" * 30)
-            print("ChangedFields")
-            print("=" * 30)
-            
+        if header.changedFields:
             # The changedFields is a bitmap that needs to be decoded
-            # This is complex and requires the object schema
-            # For the Trailhead example, it would show fields like:
+            # against the field order of the event's Avro schema
             changed_fields = self.decode_changed_fields_bitmap(
-                header['changedFields'], 
-                header.get('entityName', '')
+                header.changedFields, 
+                schema_id
             )
             
-            for field in changed_fields:
-                print(field)
-                
-            print("=" * 30)
+            separator = "=" * 30
+            logger.info("\n".join([separator, "ChangedFields", separator,
+                                   *changed_fields, separator]))
+    
+    def get_field_table(self, schema_id):
+        """
+        Build the bitmap position -> field name table for a schema
+        Built once per schema ID; compound fields (e.g. Name, Address)
+        also carry the names of their nested fields
+        """
+        field_table = self._field_table_cache.get(schema_id)
+        if field_table is None:
+            named_records = {}
+            field_table = []
+            for field in self._schema_cache[schema_id]['fields']:
+                field_types = field['type'] if isinstance(field['type'], list) else [field['type']]
+                child = None
+                for field_type in field_types:
+                    if isinstance(field_type, dict) and field_type.get('type') == 'record':
+                        named_records[field_type['name']] = field_type
+                        child = field_type
+                    elif isinstance(field_type, str) and field_type in named_records:
+                        # Later uses of a named record only reference it by name
+                        child = named_records[field_type]
+                child_names = [f['name'] for f in child['fields']] if child else None
+                field_table.append((field['name'], child_names))
+            self._field_table_cache[schema_id] = field_table
+        return field_table
     
-    def decode_changed_fields_bitmap(self, bitmap, entity_name):
+    def decode_changed_fields_bitmap(self, bitmap_fields, schema_id):
         """
         Decode the changedFields bitmap to actual field names
-        This is a complex operation that requires object metadata
+        A bit set to 1 marks the schema field at that position as changed.
+        Nested bitmaps for compound fields use the "<parentPos>-<bitmap>" form.
         
         For the Employee__c example from Trailhead, you'd see:
         - LastModifiedDate (system field)
         - First_Name__c (when first name changed)
         - Tenure__c (when tenure field changed)
         """
-        # This is a simplified version for demo purposes
-        # In production, you'd need to:
-        # 1. Get the object schema from Salesforce
-        # 2. Map bitmap positions to actual field names
-        # 3. Decode the bitmap accordingly
+        field_table = self.get_field_table(schema_id)
+        changed_fields = []
         
-        # For Employee__c updates in the Trailhead example:
-        example_changed_fields = [
-            "LastModifiedDate",
-            "First_Name__c", 
-            "Tenure__c"
-        ]
+        for bitmap in bitmap_fields:
+            if bitmap.startswith('0x'):
+                # Top-level bitmap: one bit per schema field
+                changed_fields.extend(field_table[pos][0] for pos in _bitmap_positions(bitmap))
+            elif '-' in bitmap:
+                parent_pos, child_bitmap = bitmap.split('-', 1)
+                parent_name, child_names = field_table[int(parent_pos)]
+                if child_names:
+                    changed_fields.extend(
+                        f"{parent_name}.{child_names[pos]}"
+                        for pos in _bitmap_positions(child_bitmap)
+                    )
         
-        return example_changed_fields
+        return changed_fields
 
 def main():
     """
     Main function - equivalent to running the Java client
     ./run.sh genericpubsub.Subscribe
     """
+    # Event output is buffered and written to stdout as one write per
+    # FetchResponse batch (or per 100 records); errors are written
+    # immediately. Set PUBSUB_LOG_LEVEL=DEBUG to dump every event.
+    output_handler = BatchedStreamHandler(sys.stdout)
+    
+    # The root logger keeps its WARNING default so INFO records from
+    # libraries (requests/urllib3, asyncio) stay out of the event output
+    logging.basicConfig(format='%(message)s', handlers=[output_handler])
+    
+    level_name = os.environ.get('PUBSUB_LOG_LEVEL', 'INFO').upper()
+    level = logging.getLevelName(level_name)
+    if not isinstance(level, int):
+        level = logging.INFO
+        logger.warning("Unknown PUBSUB_LOG_LEVEL %r, using INFO", level_name)
+    logger.setLevel(level)
+    
     client = SalesforcePubSubClient()
     
     print("Salesforce Change Data Capture Python Client")
@@ -275,7 +581,7 @@ def main():
         
         try:
             # This will run indefinitely, waiting for events
-            client.subscribe_to_topic(TOPIC)
+            asyncio.run(client.subscribe_to_topic(TOPIC))
         except KeyboardInterrupt:
             print("\nSubscription interrupted by user")
         except Exception as e:
@@ -301,6 +607,9 @@ PASSWORD = 'your_password_with_security_token_appended'
 TOPIC = '/data/Employee__ChangeEvent'
 PROCESS_CHANGE_EVENT_HEADER_FIELDS = True
 
+# Optional: set the PUBSUB_UDS_PATH environment variable to the Unix socket
+# of a colocated gRPC proxy (e.g. Envoy) to bypass TCP for the local hop
+
 # For the Trailhead module, make sure to:
 # 1. Create the Employee custom object as described
 # 2. Enable Change Data Capture for Employee__c
@@ -315,7 +624,7 @@ PROCESS_CHANGE_EVENT_HEADER_FIELDS = True
 
 if __name__ == "__main__":
     # Install required dependencies first:
-    # pip install grpcio grpcio-tools avro-python3
+    # pip install grpcio grpcio-tools fastavro
     
     # Generate protobuf files (one-time setup):
     # 1. Clone: git clone https://github.com/forcedotcom/pub-sub-api.git